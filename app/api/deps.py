@@ -0,0 +1,14 @@
+import app.services.document_processor as document_processor_module
+import app.services.job_manager as job_manager_module
+import app.services.template_engine as template_engine_module
+
+# Dependency providers shared by all routers. Tests replace them through
+# app.dependency_overrides (one override covers every endpoint using it).
+def get_document_processor() -> document_processor_module.DocumentProcessor:
+    return document_processor_module.DocumentProcessor()
+
+def get_job_manager() -> job_manager_module.JobManager:
+    return job_manager_module.JobManager()
+
+def get_template_engine() -> template_engine_module.TemplateEngine:
+    return template_engine_module.TemplateEngine()
@@ -8,13 +8,11 @@ from typing import List, Optional
 
 from app.core.config import settings
 import app.services.job_manager as job_manager_module
+from app.api.deps import get_job_manager
 from app.models.schemas import JobStatus
 
 router = APIRouter()
 
-def get_job_manager() -> job_manager_module.JobManager:
-    return job_manager_module.JobManager()
-
 @router.get("/{job_id}")
 async def download_result(
     job_id: str = Path(..., description="Job ID to download result"),
@@ -4,12 +4,10 @@ from typing import Dict, Any, Optional
 
 from app.models.schemas import JobResponse, JobStatus
 import app.services.job_manager as job_manager_module
+from app.api.deps import get_job_manager
 
 router = APIRouter()
 
-def get_job_manager() -> job_manager_module.JobManager:
-    return job_manager_module.JobManager()
-
 @router.get("/{job_id}/status")
 async def get_job_status(
     job_id: str = Path(..., description="Job ID to check status"),
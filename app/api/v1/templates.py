@@ -7,12 +7,10 @@ from pathlib import Path as PathLib
 from app.core.config import settings
 from app.models.schemas import TemplateInfo
 import app.services.template_engine as template_engine_module
+from app.api.deps import get_template_engine
 
 router = APIRouter()
 
-def get_template_engine() -> template_engine_module.TemplateEngine:
-    return template_engine_module.TemplateEngine()
-
 @router.get("/", response_model=List[TemplateInfo])
 async def list_templates(
     template_engine: template_engine_module.TemplateEngine = Depends(get_template_engine),
@@ -7,16 +7,10 @@ from app.core.config import settings
 from app.models.schemas import UploadResponse, BatchUploadResponse
 import app.services.document_processor as document_processor_module
 import app.services.job_manager as job_manager_module
+from app.api.deps import get_document_processor, get_job_manager
 
 router = APIRouter()
 
-# Dependency providers (simple factories). Tests can patch the classes these call.
-def get_document_processor() -> document_processor_module.DocumentProcessor:
-    return document_processor_module.DocumentProcessor()
-
-def get_job_manager() -> job_manager_module.JobManager:
-    return job_manager_module.JobManager()
-
 @router.post("/single", response_model=UploadResponse)
 async def upload_single_resume(
     file: UploadFile = File(...),
@@ -207,10 +207,7 @@ class DocumentProcessor:
     
     async def process_document(self, filename: str, use_gemini: bool = False, gemini_api_key: Optional[str] = None) -> ExtractedData:
         """Process uploaded document and extract data"""
-        file_path = self.upload_dir / filename
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {filename}")
+        file_path = self._ensure_exists(filename)
         
         # Extract text based on file type
         file_extension = file_path.suffix.lower()
@@ -295,6 +292,13 @@ class DocumentProcessor:
             pass
         return False
     
+    def _ensure_exists(self, filename: str) -> Path:
+        """Resolve an uploaded filename, raising FileNotFoundError if it is missing"""
+        file_path = self.upload_dir / filename
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {filename}")
+        return file_path
+    
     def _extract_summary(self, text: str) -> Optional[str]:
         """Extract summary/objective section from resume"""
         summary_patterns = [
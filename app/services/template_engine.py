@@ -10,13 +10,77 @@ import logging
 import re
 import shutil
 import importlib.util
-from importlib.machinery import SourceFileLoader
+from importlib.machinery import EXTENSION_SUFFIXES, SourceFileLoader
+from types import ModuleType
 
 from app.core.config import settings
 from app.models.schemas import ExtractedData, TemplateInfo
 from app.services.ezest_template_creator import EZestTemplateCreator
 from app.services.working_ezest_template import WorkingEZestTemplateCreator
 
+# User-editable generator for the code-generated ezest-coded template
+GENERATOR_PATH = Path(__file__).resolve().parents[2] / "templates" / "ezest-code-gen" / "ezest_cv_generator.py"
+
+_generator_module_cache: Dict[tuple, ModuleType] = {}
+
+
+def _compiled_generator_path(gen_path: Path) -> Optional[Path]:
+    """Return a mypyc-compiled build of the generator if one is present and up to date."""
+    for suffix in EXTENSION_SUFFIXES:
+        candidate = gen_path.with_name(gen_path.stem + suffix)
+        try:
+            if candidate.exists() and candidate.stat().st_mtime >= gen_path.stat().st_mtime:
+                return candidate
+        except OSError:
+            continue
+    return None
+
+
+def _exec_generator_module(module_path: Path) -> Optional[ModuleType]:
+    """Execute a generator module from either its source or a compiled extension."""
+    if module_path.suffix == ".py":
+        spec = importlib.util.spec_from_loader("ezest_cv_generator", SourceFileLoader("ezest_cv_generator", str(module_path)))
+    else:
+        spec = importlib.util.spec_from_file_location("ezest_cv_generator", str(module_path))
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def load_generator_module(gen_path: Path = GENERATOR_PATH) -> Optional[ModuleType]:
+    """Load the ezest_cv_generator module, preferring the mypyc-compiled build.
+
+    Falls back to the pure-Python source when no compiled build exists, it raises
+    while importing, or the source has been edited since it was built. Modules are
+    cached per file and mtime so repeated template operations don't re-execute
+    the generator.
+    """
+    candidates = [p for p in (_compiled_generator_path(gen_path), gen_path) if p is not None]
+    for module_path in candidates:
+        try:
+            key = (str(module_path), module_path.stat().st_mtime_ns)
+        except OSError:
+            continue
+        cached = _generator_module_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            module = _exec_generator_module(module_path)
+        except Exception as e:
+            # A compiled build can import yet fail while its module body runs
+            # (e.g. TypeError/AttributeError); the source is still usable then
+            if module_path == gen_path:
+                raise
+            logging.warning(f"Compiled generator failed to load ({e!r}); using pure-Python source")
+            continue
+        if module is not None:
+            _generator_module_cache[key] = module
+        return module
+    return None
+
+
 class TemplateEngine:
     """Template management and document generation engine"""
     
@@ -210,7 +274,7 @@ class TemplateEngine:
         """
         target = self.templates_dir / "ezest-coded.docx"
         # Path of the user-editable generator
-        gen_path = (Path(__file__).resolve().parents[2] / "templates" / "ezest-code-gen" / "ezest_cv_generator.py")
+        gen_path = GENERATOR_PATH
         if not gen_path.exists():
             logging.warning("Generator not found at templates/ezest-code-gen/ezest_cv_generator.py; skipping coded template creation")
             return
@@ -224,12 +288,10 @@ class TemplateEngine:
             # If stat fails for any reason, proceed to attempt regeneration
             pass
         try:
-            spec = importlib.util.spec_from_loader("ezest_cv_generator", SourceFileLoader("ezest_cv_generator", str(gen_path)))
-            if spec is None or spec.loader is None:
+            module = load_generator_module(gen_path)
+            if module is None:
                 logging.warning("Could not load ezest_cv_generator spec")
                 return
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)  # type: ignore
             if hasattr(module, "EZestCVTemplateGenerator"):
                 Generator = getattr(module, "EZestCVTemplateGenerator")
                 generator = Generator()
@@ -254,51 +316,32 @@ class TemplateEngine:
             # Simple required content checks and warnings
             self._collect_warnings(context)
 
-            # If this is the code-generated template, pre-populate rows before rendering
-            if template_id == "ezest-coded":
-                # Copy template to a temp path for in-place population prior to docxtpl rendering
-                temp_filename = f"_tmp_{uuid.uuid4().hex[:8]}_{template_id}.docx"
-                temp_path = self.output_dir / temp_filename
-                shutil.copyfile(template_path, temp_path)
+            # Generate output filename
+            output_filename = f"formatted_{uuid.uuid4().hex[:8]}_{template_id}.docx"
+            output_path = self.output_dir / output_filename
 
-                # Load the temp document and populate tables based on headers
-                doc = Document(temp_path)
-                try:
-                    gen_path = (Path(__file__).resolve().parents[2] / "templates" / "ezest-code-gen" / "ezest_cv_generator.py")
-                    spec = importlib.util.spec_from_loader("ezest_cv_generator", SourceFileLoader("ezest_cv_generator", str(gen_path)))
-                    if spec and spec.loader:
-                        module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(module)  # type: ignore
-                        if hasattr(module, "EZestCVTemplateGenerator"):
-                            Generator = getattr(module, "EZestCVTemplateGenerator")
-                            generator = Generator()
-                            # Populate sections by header markers
-                            generator.populate_skills(doc, context.get('skills_rows', []))
-                            generator.populate_other_projects(doc, context.get('other_projects', []))
-                            generator.populate_education(doc, context.get('education', []))
-                            generator.populate_certifications(doc, context.get('certifications_rows', []))
-                        else:
-                            logging.warning("EZestCVTemplateGenerator not found; skipping row population")
-                    else:
-                        logging.warning("Could not load ezest_cv_generator spec; skipping row population")
-                except Exception as e:
-                    logging.warning(f"Row population step failed, proceeding with plain rendering: {e}")
-                # Save populated temp doc
-                doc.save(temp_path)
-
-                # Now render with docxtpl using the populated temp doc
-                template = DocxTemplate(temp_path)
-            else:
-                # Non-coded templates: render directly
-                template = DocxTemplate(template_path)
+            # The code-generated template is a placeholder-free skeleton that the
+            # generator fills directly; no docxtpl pass is needed
+            if template_id == "ezest-coded":
+                module = load_generator_module()
+                if module is None or not hasattr(module, "EZestCVTemplateGenerator"):
+                    raise RuntimeError("ezest_cv_generator is unavailable; cannot render ezest-coded template")
+                generator = module.EZestCVTemplateGenerator()
+                doc = Document(template_path)
+                if not generator.matches_skeleton(doc):
+                    # An older placeholder template or an edit that dropped a section:
+                    # render onto a fresh skeleton rather than emit raw {{ }} text or fail
+                    logging.warning(f"{template_path.name} does not match the generator skeleton; rendering onto a freshly built one")
+                    self.last_warnings.append('Template ezest-coded is out of date; used the generated layout')
+                    doc = generator.build_skeleton()
+                generator.render(doc, context)
+                doc.save(output_path)
+                return output_filename
 
             # Render template
+            template = DocxTemplate(template_path)
             template.render(context)
 
-            # Generate output filename
-            output_filename = f"formatted_{uuid.uuid4().hex[:8]}_{template_id}.docx"
-            output_path = self.output_dir / output_filename
-
             # Save rendered document
             template.save(output_path)
 
@@ -9,6 +9,9 @@ import sys
 import os
 from pathlib import Path
 
+BASIC_PACKAGES = ["fastapi", "uvicorn", "python-multipart", "python-docx", "docxtpl", "redis", "aiofiles"]
+OPTIONAL_PACKAGES = ["spacy", "pytesseract", "opencv-python"]
+
 def run_command(cmd, check=True):
     """Run a command and handle errors"""
     try:
@@ -21,6 +24,18 @@ def run_command(cmd, check=True):
         print(f"Error: {e.stderr}")
         return False
 
+def pip_install(packages):
+    """Install packages in a single pip run, streaming pip's output as it goes"""
+    try:
+        subprocess.check_call([
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input",
+            *packages
+        ])
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
 def main():
     print("🚀 Starting HR Resume Formatter...")
     
@@ -37,16 +52,17 @@ def main():
         Path(dir_name).mkdir(exist_ok=True)
         print(f"📁 Created directory: {dir_name}")
     
-    # Install dependencies
+    # Install basic and optional dependencies with one resolver run
     print("📦 Installing dependencies...")
-    if not run_command("pip install fastapi uvicorn python-multipart python-docx docxtpl redis aiofiles"):
-        print("❌ Failed to install basic dependencies")
-        return False
-    
-    # Try to install optional dependencies
-    print("🔧 Installing optional dependencies...")
-    run_command("pip install spacy pytesseract opencv-python", check=False)
-    run_command("python -m spacy download en_core_web_sm", check=False)
+    if pip_install(BASIC_PACKAGES + OPTIONAL_PACKAGES):
+        subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"], check=False)
+    else:
+        # Optional packages may not build everywhere; retry with the required set only
+        print("⚠️  Optional dependencies failed to install, retrying basic dependencies only...")
+        if not pip_install(BASIC_PACKAGES):
+            print("❌ Failed to install basic dependencies")
+            return False
+        print("⚠️  spaCy not installed, skipping the en_core_web_sm model download")
     
     # Start Redis if available
     print("🔍 Checking for Redis...")
@@ -1,10 +1,161 @@
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.document import Document as DocxDocument
+from docx.shared import Emu, Inches, Length, Pt, RGBColor
+from docx.table import Table, _Cell, _Row
+from docx.text.run import Run
+from docx.enum.style import WD_STYLE_TYPE
+from docx.styles.style import CharacterStyle
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.oxml.table import CT_Tc
+from docx.oxml.xmlchemy import BaseOxmlElement
 from docx.oxml.shared import OxmlElement, qn
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from typing import IO, Any, Callable, ClassVar, Sequence
 import logging
+import re
+from xml.sax.saxutils import escape
+
+import jinja2
+
+
+# Bullet points (using a hollow circle instead of a bullet character)
+SUMMARY_TEMPLATE = """{% if summary_bullets and summary_bullets|length > 0 %}{% for bullet in summary_bullets %}○ {{ bullet }}
+{% endfor %}{% else %}{{ summary }}{% endif %}"""
+
+# Each project in its own bordered section
+EXPERIENCE_TEMPLATE = """{% for exp in experience %}
+Project #{{ loop.index }} Duration: {{ exp.start_date }} - {{ exp.end_date }}
+
+Project Summary: {{ exp.project_description if exp.project_description else exp.description }}
+
+Technologies: {{ exp.technologies|join(", ") if exp.technologies else "N/A" }}
+
+Role & Responsibilities:
+{% for resp in exp.responsibilities %}- {{ resp }}
+{% endfor %}
+
+{% endfor %}"""
+
+# Jinja templates for the free-text sections, keyed by the name render_template() takes.
+# Everything else is written into the document directly by the populate_* methods.
+_TEMPLATES = {
+    'summary': SUMMARY_TEMPLATE,
+    'experience': EXPERIENCE_TEMPLATE,
+}
+
+# Shared environment: each template is compiled once per process and reused
+_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader(_TEMPLATES),
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+def render_template(name: str, ctx: dict[str, Any]) -> str:
+    """Render one of the generator's Jinja templates with the given context."""
+    return _ENV.get_template(name).render(ctx)
+
+
+# First run anywhere inside a table cell
+_W_R_PATH = './/' + qn('w:r')
+# Text nodes, and the Jinja delimiters that mark a pre-skeleton (docxtpl) template
+_W_T = qn('w:t')
+_JINJA_MARKERS = re.compile(r'\{\{|\{%')
+# Header rows of the data tables populated by the populate_* methods
+_DATA_TABLE_HEADERS = (
+    ['Category', 'Skills'],
+    ['Project Name', 'Duration', 'Technology'],
+    ['Course', 'University / Board', 'Year of Passing'],
+    ['Sr.No', 'University/Board'],
+)
+# CT_TcPr has no tcBorders accessor, so look the child up by its Clark name
+_W_TC_BORDERS = qn('w:tcBorders')
+
+
+def _read_default_template_bytes() -> bytes:
+    """python-docx's built-in default document, as .docx bytes"""
+    buf = BytesIO()
+    Document().save(buf)
+    return buf.getvalue()
+
+
+# Read once at import so each skeleton build opens an in-memory copy instead of
+# re-reading the default template package from disk
+_DEFAULT_DOCX_BYTES = _read_default_template_bytes()
+
+
+@lru_cache(maxsize=32)
+def _rgb_hex_static(rgb: tuple[int, int, int]) -> str:
+    """Return lowercase hex string RRGGBB for an (r, g, b) tuple such as RGBColor."""
+    return bytes(rgb).hex()
+
+
+def _rgb_to_hex_slow(rgb: Any) -> str:
+    """Best-effort RRGGBB for color values that are not a plain 3-tuple of ints."""
+    try:
+        r, g, b = int(rgb[0]), int(rgb[1]), int(rgb[2])
+        return f"{r:02x}{g:02x}{b:02x}"
+    except Exception:
+        # Fallback: try attribute ._rgb or .rgb if they exist
+        try:
+            val = getattr(rgb, 'rgb', None) or getattr(rgb, '_rgb', None)
+            if val is not None:
+                # val may be bytes or int-like
+                if isinstance(val, (bytes, bytearray)) and len(val) == 3:
+                    r, g, b = val[0], val[1], val[2]
+                    return f"{r:02x}{g:02x}{b:02x}"
+                try:
+                    return f"{int(val):06x}"
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        return "000000"
+
+
+@dataclass(frozen=True, slots=True)
+class EZestStyle:
+    """Fonts, colors, spacing and margins of the generated template.
+
+    Frozen so a style can key the skeleton cache; derive variants with
+    dataclasses.replace(EZestStyle(), body_font=...).
+    """
+    heading_font: str = 'Calibri'          # Main section headings font
+    body_font: str = 'Segoe UI'            # Body text font
+    name_font_size: Length = Pt(16)        # Candidate name size
+    title_font_size: Length = Pt(10)       # Job title size
+    heading_font_size: Length = Pt(14)     # Section headings size
+    body_font_size: Length = Pt(10)        # Regular body text size
+    table_header_font_size: Length = Pt(11)  # Table headers size
+
+    # COLORS
+    heading_color: RGBColor = RGBColor(0x17, 0x36, 0x5D)      # Dark blue for headings
+    body_color: RGBColor = RGBColor(0x00, 0x00, 0x00)         # Black for body text
+    table_header_bg: RGBColor = RGBColor(0x17, 0x36, 0x5D)    # Blue background for table headers
+    table_header_text: RGBColor = RGBColor(255, 255, 255)     # White text for headers
+    table_border_color: RGBColor = RGBColor(0xBF, 0xBF, 0xBF) # Gray borders
+
+    # SPACING
+    section_spacing_before: Length = Pt(12)
+    section_spacing_after: Length = Pt(6)
+    paragraph_spacing: Length = Pt(3)
+    section_gap: Length = Pt(24)           # Space above a heading that follows a table
+
+    # BASE DOCUMENT - optional .docx whose styles/settings the skeleton starts from
+    base_template: Path | None = None
+
+    # MARGINS
+    doc_margin_top: Length = Inches(0.8)
+    doc_margin_bottom: Length = Inches(0.8)
+    doc_margin_left: Length = Inches(0.75)
+    doc_margin_right: Length = Inches(0.75)
 
 
 class EZestCVTemplateGenerator:
@@ -12,104 +163,159 @@ class EZestCVTemplateGenerator:
     Complete e-Zest CV Template Generator with global styling variables
     Based on Rahul Shrivastav CV format with all sections
     """
-    
-    def __init__(self):
+
+    # Built skeletons as .docx bytes, keyed by the style they were built with
+    _skeleton_cache: ClassVar[dict[EZestStyle, bytes]] = {}
+
+    def __init__(self, style: EZestStyle | None = None) -> None:
         self.logger = logging.getLogger(__name__)
+
+        # GLOBAL STYLING VARIABLES - pass an EZestStyle to apply across entire template
+        self.style = style if style is not None else EZestStyle()
+        st = self.style
+
+        # Tables of the document being built/populated, keyed by header texts
+        self._table_map: dict[tuple[str, ...], Table] = {}
+        self._table_map_part: Any = None
+        self._table_map_complete = False
+
+        # Compile every Jinja template up front (cached on the shared environment)
+        # so a syntax error fails generator setup instead of the first CV render
+        for name in _TEMPLATES:
+            _ENV.get_template(name)
         
-        # GLOBAL STYLING VARIABLES - Change these to apply across entire template
-        self.HEADING_FONT = 'Calibri'          # Main section headings font
-        self.BODY_FONT = 'Segoe UI'            # Body text font
-        self.NAME_FONT_SIZE = Pt(16)           # Candidate name size
-        self.TITLE_FONT_SIZE = Pt(12)          # Job title size
-        self.HEADING_FONT_SIZE = Pt(14)        # Section headings size
-        self.BODY_FONT_SIZE = Pt(10)           # Regular body text size
-        self.TABLE_HEADER_FONT_SIZE = Pt(11)   # Table headers size
-        
-        # COLORS
-        self.HEADING_COLOR = RGBColor(0x17, 0x36, 0x5D)      # Dark blue for headings
-        self.BODY_COLOR = RGBColor(0x00, 0x00, 0x00)         # Black for body text
-        self.TABLE_HEADER_BG = RGBColor(0x17, 0x36, 0x5D)    # Blue background for table headers
-        self.TABLE_HEADER_TEXT = RGBColor(255, 255, 255)     # White text for headers
-        self.TABLE_BORDER_COLOR = RGBColor(0xBF, 0xBF, 0xBF) # Gray borders
-        
-        # SPACING
-        self.SECTION_SPACING_BEFORE = Pt(12)
-        self.SECTION_SPACING_AFTER = Pt(6)
-        self.PARAGRAPH_SPACING = Pt(3)
+        # Hex forms of the colors written into per-cell OXML; RGBColor is a 3-tuple
+        # of 0-255 ints, anything else takes the slow path
+        self._border_hex, self._header_bg_hex = (
+            _rgb_hex_static(rgb) if isinstance(rgb, tuple) and len(rgb) == 3 else _rgb_to_hex_slow(rgb)
+            for rgb in (st.table_border_color, st.table_header_bg)
+        )
+        self._header_text_hex = str(st.table_header_text)  # as RGBColor writes w:color
+
+        # Cell border block, parsed once and copied into every table cell built
+        # through python-docx; raw-XML tables embed the string directly
+        self._tc_borders_xml = (
+            '<w:tcBorders>'
+            + ''.join(
+                f'<w:{side} w:val="single" w:sz="4" w:color="{self._border_hex}"/>'
+                for side in ('top', 'left', 'bottom', 'right')
+            )
+            + '</w:tcBorders>'
+        )
+        self._tc_borders_proto = parse_xml(
+            self._tc_borders_xml.replace('<w:tcBorders>', f'<w:tcBorders {nsdecls("w")}>', 1)
+        )
         
-        # MARGINS
-        self.DOC_MARGIN_TOP = Inches(0.8)
-        self.DOC_MARGIN_BOTTOM = Inches(0.8)
-        self.DOC_MARGIN_LEFT = Inches(0.75)
-        self.DOC_MARGIN_RIGHT = Inches(0.75)
+        # Margins as the w:pgMar attributes (twips) they end up in, written in one batch
+        self._pg_margins = {
+            qn('w:top'): str(st.doc_margin_top.twips),
+            qn('w:bottom'): str(st.doc_margin_bottom.twips),
+            qn('w:left'): str(st.doc_margin_left.twips),
+            qn('w:right'): str(st.doc_margin_right.twips),
+        }
     
-    def create_complete_template(self, template_path: Path):
-        """Create the complete e-Zest CV template with all sections"""
+    def create_complete_template(self, target: Path | IO[bytes]) -> None:
+        """Create the complete e-Zest CV template with all sections.
+
+        target is a file path or any writable binary file-like object (e.g. a
+        BytesIO or an upload stream), so callers that want bytes skip the disk.
+        """
+        key = self.style
+        cached = self._skeleton_cache.get(key)
+        if cached is None:
+            buf = BytesIO()
+            self._build_template(buf)
+            cached = self._skeleton_cache[key] = buf.getvalue()
+        if isinstance(target, (str, Path)):
+            Path(target).write_bytes(cached)
+            self.logger.info(f"Complete e-Zest template created at {target}")
+        else:
+            target.write(cached)
+            self.logger.info("Complete e-Zest template written to stream")
+
+    def _build_template(self, target: BytesIO) -> None:
+        """Build the template document from scratch and save it to target"""
         try:
-            doc = Document()
-            
-            # Set document margins
-            self._set_document_margins(doc)
-            
-            # Add all sections in order
-            self._add_header_section(doc)
-            self._add_profile_summary(doc)
-            self._add_tools_technologies(doc)
-            self._add_work_experience(doc)
-            self._add_other_projects(doc)
-            self._add_education_details(doc)
-            self._add_certifications(doc)
-            
-            # Save template
-            doc.save(template_path)
-            self.logger.info(f"Complete e-Zest template created at {template_path}")
-            
+            self.build_skeleton().save(target)
         except Exception as e:
             self.logger.error(f"Error creating template: {str(e)}")
             raise
+
+    def build_skeleton(self) -> DocxDocument:
+        """Build the styled CV layout: headings, header rows and empty template rows.
+
+        The skeleton holds no placeholders; render() fills it with a CV's data.
+        """
+        base_template = self.style.base_template
+        if base_template is not None:
+            # Keep the base document's styles and section settings, not its content
+            doc = Document(str(base_template))
+            doc.element.body.clear_content()
+        else:
+            doc = Document(BytesIO(_DEFAULT_DOCX_BYTES))
+
+        # Set document margins
+        self._set_document_margins(doc)
+
+        # Shared character styles referenced by runs instead of per-run fonts
+        self._register_styles(doc)
+
+        # Add all sections in order
+        self._add_header_section(doc)
+        self._add_profile_summary(doc)
+        self._add_tools_technologies(doc)
+        self._add_work_experience(doc)
+        self._add_other_projects(doc)
+        self._add_education_details(doc)
+        self._add_certifications(doc)
+        return doc
+
+    def render(self, doc: DocxDocument, ctx: dict[str, Any]) -> None:
+        """Fill a skeleton built by build_skeleton() with a CV's template context"""
+        self.populate_header(doc, ctx.get('contact_info') or {})
+        self.populate_summary(doc, ctx)
+        self.populate_skills(doc, ctx.get('skills_rows', []))
+        self.populate_experience(doc, ctx.get('experience', []))
+        self.populate_other_projects(doc, ctx.get('other_projects', []))
+        self.populate_education(doc, ctx.get('education', []))
+        self.populate_certifications(doc, ctx.get('certifications_rows', []))
     
-    def _set_document_margins(self, doc):
+    def _set_document_margins(self, doc: DocxDocument) -> None:
         """Set document margins"""
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = self.DOC_MARGIN_TOP
-            section.bottom_margin = self.DOC_MARGIN_BOTTOM
-            section.left_margin = self.DOC_MARGIN_LEFT
-            section.right_margin = self.DOC_MARGIN_RIGHT
+        for sectPr in doc.element.sectPr_lst:
+            pgMar = sectPr.get_or_add_pgMar()
+            # Only touch the attributes that differ (e.g. a BASE_TEMPLATE may already match)
+            changed = {k: v for k, v in self._pg_margins.items() if pgMar.get(k) != v}
+            if changed:
+                pgMar.attrib.update(changed)
     
-    def _add_header_section(self, doc):
-    # Candidate Name
+    def _add_header_section(self, doc: DocxDocument) -> None:
+        """Add the candidate name and job title runs followed by a horizontal rule"""
+        # Candidate Name
         name_para = doc.add_paragraph()
-        run = name_para.add_run('{{ contact_info.name }}')
-        run.font.name = 'Calibri'
-        run.font.size = Pt(16)
-        run.font.color.rgb = self.HEADING_COLOR
-        run.bold = True
+        name_para.add_run().style = self._name_style
         name_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
         name_para.space_after = Pt(0)
 
         # Job Title
         title_para = doc.add_paragraph()
-        run = title_para.add_run('({{ contact_info.title|default("Professional Title") }})')
-        run.font.name = 'Segoe UI'
-        run.font.size = Pt(10)
-        run.bold = True
+        title_para.add_run().style = self._title_style
         title_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
         title_para.space_after = Pt(6)
 
-        # Horizontal rule (thin gray line)
+        # Horizontal rule (thin line in the table border gray)
         p = doc.add_paragraph()._p
         pPr = p.get_or_add_pPr()
         pBdr = OxmlElement('w:pBdr')
         bottom = OxmlElement('w:bottom')
         bottom.set(qn('w:val'), 'single')
         bottom.set(qn('w:sz'), '4')
-        bottom.set(qn('w:color'), 'BFBFBF')
+        bottom.set(qn('w:color'), self._border_hex)
         pBdr.append(bottom)
         pPr.append(pBdr)
 
     
-    def _add_profile_summary(self, doc):
+    def _add_profile_summary(self, doc: DocxDocument) -> None:
         """Add Profile Summary section with bullet points"""
         # Section heading
         self._add_section_heading(doc, 'Profile Summary')
@@ -119,24 +325,18 @@ class EZestCVTemplateGenerator:
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
         self._set_table_borders(table)
         
-        cell = table.cell(0, 0)
+        cell = self._row_cells(table, table.rows[0])[0]
         
-        # Add Jinja2 template for bullet points (using dash instead of bullet character)
+        # Run filled with the rendered bullet points
         summary_para = cell.paragraphs[0]
-        summary_text = """{% if summary_bullets and summary_bullets|length > 0 %}{% for bullet in summary_bullets %}○ {{ bullet }}
-{% endfor %}{% else %}{{ summary }}{% endif %}"""
-        
-        summary_run = summary_para.add_run(summary_text)
-        summary_run.font.name = self.BODY_FONT
-        summary_run.font.size = self.BODY_FONT_SIZE
-        # Avoid explicit RGB assignment for cross-environment compatibility
+        summary_run = summary_para.add_run()
+        self._format_body_text(summary_run)
         summary_para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        summary_para.space_before = self.PARAGRAPH_SPACING
-        summary_para.space_after = self.PARAGRAPH_SPACING
-        
-        self._add_section_spacing(doc)
+        paragraph_spacing = self.style.paragraph_spacing
+        summary_para.space_before = paragraph_spacing
+        summary_para.space_after = paragraph_spacing
     
-    def _add_tools_technologies(self, doc):
+    def _add_tools_technologies(self, doc: DocxDocument) -> None:
         """Add Tools and Technologies section with 2-column layout"""
         # Section heading
         self._add_section_heading(doc, 'Tools and Technologies')
@@ -146,389 +346,363 @@ class EZestCVTemplateGenerator:
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
         self._set_table_borders(table)
 
-        # Set column widths (approximately 40% and 60%)
-        table.columns[0].width = Inches(2.5)
-        table.columns[1].width = Inches(4.0)
+        # Set column widths (approximately 40% and 60%) on the w:gridCol elements
+        for grid_col, width in zip(table._tbl.tblGrid.gridCol_lst, (Inches(2.5), Inches(4.0))):
+            grid_col.w = width
 
         # Header row text used as detection marker
-        table.cell(0, 0).text = 'Category'
-        table.cell(0, 1).text = 'Skills'
-
-        # Template row with simple placeholders (no loops)
-        table.cell(1, 0).text = '{{ skill_row.left }}'
-        table.cell(1, 1).text = '{{ skill_row.right }}'
+        header_cells, template_cells = (self._row_cells(table, row) for row in table.rows)
+        header_cells[0].text = 'Category'
+        header_cells[1].text = 'Skills'
+        self._register_table(doc, ['Category', 'Skills'], table)
 
-        self._add_section_spacing(doc)
+        # Empty template row, cloned once per skills row
+        for cell in template_cells:
+            self._format_body_text(cell.paragraphs[0].add_run())
     
-    def _add_work_experience(self, doc):
+    def _add_work_experience(self, doc: DocxDocument) -> None:
         """Add Relevant Work Experience section with detailed project boxes"""
         # Section heading
         self._add_section_heading(doc, 'Relevant Work Experience')
         
-        # Experience template with boxes - each project in its own bordered section
-        exp_template = """{% for exp in experience %}
-Project #{{ loop.index }} Duration: {{ exp.start_date }} - {{ exp.end_date }}
-
-Project Summary: {{ exp.project_description if exp.project_description else exp.description }}
-
-Technologies: {{ exp.technologies|join(", ") if exp.technologies else "N/A" }}
-
-Role & Responsibilities:
-{% for resp in exp.responsibilities %}- {{ resp }}
-{% endfor %}
-
-{% endfor %}"""
-        
         # Create table for structured layout
         table = doc.add_table(rows=1, cols=1)
         table.alignment = WD_TABLE_ALIGNMENT.CENTER
         self._set_table_borders(table)
         
-        cell = table.cell(0, 0)
+        cell = self._row_cells(table, table.rows[0])[0]
         para = cell.paragraphs[0]
-        run = para.add_run(exp_template)
+        run = para.add_run()
         self._format_body_text(run)
         para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        
-        self._add_section_spacing(doc)
     
-    def _add_other_projects(self, doc):
+    def _add_other_projects(self, doc: DocxDocument) -> None:
         """Add Other Notable Projects section with 3-column table"""
         # Section heading
         self._add_section_heading(doc, 'Other Notable Projects')
-        
-        # Create 3-column table with header
-        table = doc.add_table(rows=4, cols=3)  # Header + 3 data rows
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        self._set_table_borders(table)
-        
-        # Header row
+
+        # Header + empty template row (name, duration, technology), cloned once per project
+        # Avoid explicit RGB assignment for cross-environment compatibility
         headers = ['Project Name', 'Duration', 'Technology']
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            self._set_cell_background(cell, self.TABLE_HEADER_BG)
-            para = cell.paragraphs[0]
-            run = para.add_run(header)
-            run.font.name = self.HEADING_FONT
-            run.font.size = self.TABLE_HEADER_FONT_SIZE
-            # Avoid explicit RGB assignment for cross-environment compatibility
-            run.bold = True
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Add template rows for data (rows 1-3)
-        for row_idx in range(1, 4):
-            # Project name
-            para1 = table.cell(row_idx, 0).paragraphs[0]
-            run1 = para1.add_run('{% if other_projects and other_projects|length > ' + str(row_idx-1) + ' %}{{ other_projects[' + str(row_idx-1) + '].name }}{% endif %}')
-            self._format_body_text(run1)
-            para1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Duration
-            para2 = table.cell(row_idx, 1).paragraphs[0]
-            run2 = para2.add_run('{% if other_projects and other_projects|length > ' + str(row_idx-1) + ' %}{{ other_projects[' + str(row_idx-1) + '].duration }}{% endif %}')
-            self._format_body_text(run2)
-            para2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Technology
-            para3 = table.cell(row_idx, 2).paragraphs[0]
-            run3 = para3.add_run('{% if other_projects and other_projects|length > ' + str(row_idx-1) + ' %}{{ other_projects[' + str(row_idx-1) + '].technologies|join(", ") }}{% endif %}')
-            self._format_body_text(run3)
-            para3.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        self._add_section_spacing(doc)
+        table = self._append_raw_table(doc, self._data_table_xml(doc, headers, header_text_color=False))
+        self._register_table(doc, headers, table)
     
-    def _add_education_details(self, doc):
+    def _add_education_details(self, doc: DocxDocument) -> None:
         """Add Education Details section with 3-column table"""
         # Section heading
         self._add_section_heading(doc, 'Education Details')
-        
-        # Create 3-column table
-        table = doc.add_table(rows=2, cols=3)  # Header + 1 data row
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        self._set_table_borders(table)
-        
-        # Header row
+
+        # Header + empty template row (course, university, year), cloned once per entry
         headers = ['Course', 'University / Board', 'Year of Passing']
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            self._set_cell_background(cell, self.TABLE_HEADER_BG)
-            para = cell.paragraphs[0]
-            run = para.add_run(header)
-            run.font.name = self.HEADING_FONT
-            run.font.size = self.TABLE_HEADER_FONT_SIZE
-            run.font.color.rgb = self.TABLE_HEADER_TEXT
-            run.bold = True
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Add template row for education data
-        # Course
-        para1 = table.cell(1, 0).paragraphs[0]
-        run1 = para1.add_run('{% for edu in education %}{{ edu.degree }}{% if not loop.last %}, {% endif %}{% endfor %}')
-        self._format_body_text(run1)
-        para1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # University
-        para2 = table.cell(1, 1).paragraphs[0]
-        run2 = para2.add_run('{% for edu in education %}{{ edu.institution }}{% if not loop.last %}, {% endif %}{% endfor %}')
-        self._format_body_text(run2)
-        para2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Year
-        para3 = table.cell(1, 2).paragraphs[0]
-        run3 = para3.add_run('{% for edu in education %}{{ edu.graduation_date }}{% if not loop.last %}, {% endif %}{% endfor %}')
-        self._format_body_text(run3)
-        para3.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        self._add_section_spacing(doc)
+        table = self._append_raw_table(doc, self._data_table_xml(doc, headers))
+        self._register_table(doc, headers, table)
     
-    def _add_certifications(self, doc):
+    def _add_certifications(self, doc: DocxDocument) -> None:
         """Add Certifications section with 2-column table"""
         # Section heading
         self._add_section_heading(doc, 'Certifications')
-        
-        # Create 2-column table
-        table = doc.add_table(rows=6, cols=2)  # Header + 5 data rows
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
-        self._set_table_borders(table)
-        
-        # Set column widths
-        table.columns[0].width = Inches(1.0)
-        table.columns[1].width = Inches(5.5)
-        
-        # Header row
+
+        # Header + empty template row (serial number, certification), cloned once per row
         headers = ['Sr.No', 'University/Board']
-        for i, header in enumerate(headers):
-            cell = table.cell(0, i)
-            self._set_cell_background(cell, self.TABLE_HEADER_BG)
-            para = cell.paragraphs[0]
-            run = para.add_run(header)
-            run.font.name = self.HEADING_FONT
-            run.font.size = self.TABLE_HEADER_FONT_SIZE
-            run.font.color.rgb = self.TABLE_HEADER_TEXT
-            run.bold = True
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Add template rows for certifications (rows 1-5)
-        for i in range(1, 6):
-            # Serial number
-            para1 = table.cell(i, 0).paragraphs[0]
-            run1 = para1.add_run('{% if certifications_rows and certifications_rows|length > ' + str(i-1) + ' %}{{ certifications_rows[' + str(i-1) + '].sno }}{% endif %}')
-            self._format_body_text(run1)
-            para1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            
-            # Certification name
-            para2 = table.cell(i, 1).paragraphs[0]
-            run2 = para2.add_run('{% if certifications_rows and certifications_rows|length > ' + str(i-1) + ' %}{{ certifications_rows[' + str(i-1) + '].authority }}{% endif %}')
-            self._format_body_text(run2)
-            para2.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        table = self._append_raw_table(
+            doc, self._data_table_xml(doc, headers, grid_widths=[Inches(1.0), Inches(5.5)]))
+        self._register_table(doc, headers, table)
     
     # HELPER METHODS
+
+    def _data_table_xml(self, doc: DocxDocument, headers: list[str],
+                        grid_widths: list[Length] | None = None,
+                        header_text_color: bool = True) -> str:
+        """OOXML for a centered, bordered data table: a shaded header row with the
+        given texts plus one empty template row of centered body-text runs."""
+        cols = len(headers)
+        # Same default cell width python-docx's add_table uses: text width split evenly
+        tc_w = Emu(doc._block_width // cols).twips
+        grid = ''.join(f'<w:gridCol w:w="{w.twips if grid_widths else tc_w}"/>'
+                       for w in (grid_widths or [None] * cols))
+        tc_pr = f'<w:tcW w:type="dxa" w:w="{tc_w}"/>{self._tc_borders_xml}'
+        color = f'<w:color w:val="{self._header_text_hex}"/>' if header_text_color else ''
+        header_rpr = f'<w:rPr><w:rStyle w:val="{self._table_header_style.style_id}"/>{color}</w:rPr>'
+        header_cells = ''.join(
+            f'<w:tc><w:tcPr>{tc_pr}<w:shd w:fill="{self._header_bg_hex}"/></w:tcPr>'
+            f'<w:p><w:pPr><w:jc w:val="center"/></w:pPr><w:r>{header_rpr}<w:t>{escape(h)}</w:t></w:r></w:p></w:tc>'
+            for h in headers
+        )
+        template_cell = (
+            f'<w:tc><w:tcPr>{tc_pr}</w:tcPr><w:p><w:pPr><w:jc w:val="center"/></w:pPr>'
+            f'<w:r><w:rPr><w:rStyle w:val="{self._body_style.style_id}"/></w:rPr></w:r></w:p></w:tc>'
+        )
+        return (
+            f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblW w:type="auto" w:w="0"/><w:jc w:val="center"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+            ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+            f'<w:tblGrid>{grid}</w:tblGrid>'
+            f'<w:tr>{header_cells}</w:tr><w:tr>{template_cell * cols}</w:tr></w:tbl>'
+        )
+
+    def _append_raw_table(self, doc: DocxDocument, xml: str) -> Table:
+        """Parse a whole w:tbl in one go and add it at the end of the body (before sectPr)"""
+        tbl = parse_xml(xml)
+        doc.element.body._insert_tbl(tbl)
+        return Table(tbl, doc._body)
+
+    def _register_styles(self, doc: DocxDocument) -> None:
+        """Define the EZ character styles once so runs only need a style reference.
+
+        A base document that already has them (e.g. an earlier generator output)
+        keeps its styles, with the font properties re-applied from self.style.
+        """
+        st = self.style
+        heading_font = st.heading_font
+
+        self._body_style = self._character_style(doc, 'EZBody')
+        self._body_style.font.name = st.body_font
+        self._body_style.font.size = st.body_font_size
+        # Avoid explicit RGB assignment for cross-environment compatibility
+
+        self._name_style = self._character_style(doc, 'EZName')
+        self._name_style.font.name = heading_font
+        self._name_style.font.size = st.name_font_size
+        self._name_style.font.color.rgb = st.heading_color
+        self._name_style.font.bold = True
+
+        self._title_style = self._character_style(doc, 'EZTitle')
+        self._title_style.font.name = st.body_font
+        self._title_style.font.size = st.title_font_size
+        self._title_style.font.bold = True
+
+        self._heading_style = self._character_style(doc, 'EZHeading')
+        self._heading_style.font.name = heading_font
+        self._heading_style.font.size = st.heading_font_size
+        self._heading_style.font.bold = True
+
+        self._table_header_style = self._character_style(doc, 'EZTableHeader')
+        self._table_header_style.font.name = heading_font
+        self._table_header_style.font.size = st.table_header_font_size
+        self._table_header_style.font.bold = True
+
+    @staticmethod
+    def _character_style(doc: DocxDocument, name: str) -> CharacterStyle:
+        """Return doc's character style called name, adding it if missing"""
+        styles = doc.styles
+        if name in styles:
+            return styles[name]
+        return styles.add_style(name, WD_STYLE_TYPE.CHARACTER)
     
-    def _add_section_heading(self, doc, text):
+    def _add_section_heading(self, doc: DocxDocument, text: str) -> None:
         """Add a section heading with consistent formatting"""
+        st = self.style
         para = doc.add_paragraph()
+        # Separate the heading from a preceding table with paragraph spacing rather
+        # than an empty spacer paragraph
+        prev = para._p.getprevious()
+        if prev is not None and prev.tag == qn('w:tbl'):
+            para.paragraph_format.space_before = st.section_gap
         run = para.add_run(text)
-        run.font.name = self.HEADING_FONT
-        run.font.size = self.HEADING_FONT_SIZE
-        # Avoid explicit RGB assignment for cross-environment compatibility
-        run.bold = True
+        run.style = self._heading_style
         para.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        para.space_before = self.SECTION_SPACING_BEFORE
-        para.space_after = self.SECTION_SPACING_AFTER
+        para.space_before = st.section_spacing_before
+        para.space_after = st.section_spacing_after
     
-    def _add_section_spacing(self, doc):
-        """Add spacing between sections"""
-        para = doc.add_paragraph()
-        para.space_after = self.SECTION_SPACING_AFTER
-    
-    def _format_body_text(self, run):
+    def _format_body_text(self, run: Run) -> None:
         """Apply consistent body text formatting"""
-        run.font.name = self.BODY_FONT
-        run.font.size = self.BODY_FONT_SIZE
-        # Avoid explicit RGB assignment for cross-environment compatibility
+        run.style = self._body_style
     
-    def _set_table_borders(self, table):
+    def _set_table_borders(self, table: Table) -> None:
         """Set consistent table borders"""
-        for row in table.rows:
-            for cell in row.cells:
-                tc = cell._tc
+        proto = self._tc_borders_proto
+        for tr in table._tbl.tr_lst:
+            for tc in tr.tc_lst:
                 tcPr = tc.get_or_add_tcPr()
-                tcBorders = tcPr.first_child_found_in("w:tcBorders")
-                if tcBorders is None:
-                    tcBorders = OxmlElement('w:tcBorders')
-                    tcPr.append(tcBorders)
-                
-                for border_name in ['top', 'left', 'bottom', 'right']:
-                    border = OxmlElement(f'w:{border_name}')
-                    border.set(qn('w:val'), 'single')
-                    border.set(qn('w:sz'), '4')
-                    border.set(qn('w:color'), self._rgb_hex(self.TABLE_BORDER_COLOR))
-                    tcBorders.append(border)
+                existing = tcPr.find(_W_TC_BORDERS)
+                if existing is not None:
+                    tcPr.remove(existing)
+                tcPr.append(deepcopy(proto))
     
-    def _set_cell_background(self, cell, color):
-        """Set cell background color"""
-        tc = cell._tc
-        tcPr = tc.get_or_add_tcPr()
-        shd = OxmlElement('w:shd')
-        shd.set(qn('w:fill'), self._rgb_hex(color))
-        tcPr.append(shd)
-
-    def _rgb_hex(self, rgb: RGBColor) -> str:
-        """Return lowercase hex string RRGGBB for a python-docx RGBColor value."""
-        try:
-            r, g, b = int(rgb[0]), int(rgb[1]), int(rgb[2])
-            return f"{r:02x}{g:02x}{b:02x}"
-        except Exception:
-            # Fallback: try attribute ._rgb or .rgb if they exist
-            try:
-                val = getattr(rgb, 'rgb', None) or getattr(rgb, '_rgb', None)
-                if val is not None:
-                    # val may be bytes or int-like
-                    if isinstance(val, (bytes, bytearray)) and len(val) == 3:
-                        r, g, b = val[0], val[1], val[2]
-                        return f"{r:02x}{g:02x}{b:02x}"
-                    try:
-                        return f"{int(val):06x}"
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            return "000000"
-
     # ==== Dynamic row helpers and population methods ====
-    def _clone_row(self, table, row_idx: int):
-        """Clone a row in the table for populating data while preserving formatting."""
-        from copy import deepcopy
-        tr = table.rows[row_idx]._tr
-        new_tr = deepcopy(tr)
-        table._tbl.append(new_tr)
-        return table.rows[-1]
-
-    def _clear_data_rows(self, table, header_rows: int = 1):
+    @staticmethod
+    def _row_cells(table: Table, row: _Row) -> list[_Cell]:
+        """Cells of a row straight from its w:tc children, skipping python-docx's
+        merged-cell grid walk (the generated tables have no merged cells)."""
+        return [_Cell(tc, table) for tc in row._tr.tc_lst]
+
+    @staticmethod
+    def _fast_cell_set(table: Table, tc: CT_Tc, text: str) -> None:
+        """Set a cloned template cell's text in its existing run, keeping the run's
+        style and the paragraph's alignment; falls back to _Cell.text (which
+        rebuilds the cell content) when the cell has no run."""
+        r = tc.find(_W_R_PATH)
+        if r is None:
+            _Cell(tc, table).text = text
+        else:
+            r.text = text
+
+    def _clear_data_rows(self, table: Table, header_rows: int = 1) -> None:
         """Remove all rows after the given number of header rows."""
         while len(table.rows) > header_rows:
             table._tbl.remove(table.rows[-1]._tr)
 
-    def _find_table_by_headers(self, doc, headers: list[str]):
+    @staticmethod
+    def _header_key(headers: list[str]) -> tuple[str, ...]:
+        return tuple(h.strip().lower() for h in headers)
+
+    def _tables_for(self, doc: DocxDocument) -> dict[tuple[str, ...], Table]:
+        """Header-row -> table map for doc, reset whenever a different document is used."""
+        if self._table_map_part is not doc.part:
+            self._table_map = {}
+            self._table_map_part = doc.part
+            self._table_map_complete = False
+        return self._table_map
+
+    def _register_table(self, doc: DocxDocument, headers: list[str], table: Table) -> None:
+        """Remember a table built for doc under its header texts."""
+        self._tables_for(doc)[self._header_key(headers)] = table
+
+    def _find_table_by_headers(self, doc: DocxDocument, headers: list[str]) -> Table | None:
         """Find a table whose first row's cell texts match the provided headers (startswith match)."""
-        hdrs_lower = [h.strip().lower() for h in headers]
+        table_map = self._tables_for(doc)
+        key = self._header_key(headers)
+        if key not in table_map and not self._table_map_complete:
+            # Index every table's header row in one pass over doc.tables
+            for t in doc.tables:
+                if len(t.rows) > 0:
+                    table_map.setdefault(
+                        self._header_key([c.text for c in self._row_cells(t, t.rows[0])]), t)
+            self._table_map_complete = True
+        if key in table_map:
+            return table_map[key]
+        hdrs_lower = list(key)
         for t in doc.tables:
             if len(t.rows) == 0:
                 continue
-            first = t.rows[0]
-            if len(first.cells) < len(headers):
+            cells = self._row_cells(t, t.rows[0])
+            if len(cells) < len(headers):
                 continue
-            row_texts = [first.cells[i].text.strip().lower() for i in range(len(headers))]
+            row_texts = [cells[i].text.strip().lower() for i in range(len(headers))]
             # startswith allows minor variations
             if all(row_texts[i].startswith(hdrs_lower[i]) for i in range(len(headers))):
+                table_map[key] = t
                 return t
         return None
 
-    def _remove_row(self, table, row_idx: int):
-        """Remove a row from a python-docx table by index."""
-        try:
-            row = table.rows[row_idx]
-            tbl = table._tbl
-            tr = row._tr
-            tbl.remove(tr)
-        except Exception:
-            # Fallback: clear cell texts to avoid rendering placeholders
-            if 0 <= row_idx < len(table.rows):
-                for cell in table.rows[row_idx].cells:
-                    cell.text = ""
+    def _table_after_heading(self, doc: DocxDocument, heading: str) -> Table | None:
+        """Find the table placed directly after the section heading with the given text."""
+        for para in doc.paragraphs:
+            if para.text.strip() == heading:
+                nxt = para._p.getnext()
+                if nxt is not None and nxt.tag == qn('w:tbl'):
+                    return Table(nxt, doc._body)
+        return None
 
-    def populate_skills(self, doc, skills_rows: list[dict]):
+    def matches_skeleton(self, doc: DocxDocument) -> bool:
+        """Whether doc has the layout render() fills: the name/title header runs and
+        every section table, with no Jinja placeholders left from older templates."""
+        if any(_JINJA_MARKERS.search(t.text or '') for t in doc.element.body.iter(_W_T)):
+            return False
+        paragraphs = doc.paragraphs
+        if len(paragraphs) < 2 or not (paragraphs[0].runs and paragraphs[1].runs):
+            return False
+        if any(self._table_after_heading(doc, heading) is None
+               for heading in ('Profile Summary', 'Relevant Work Experience')):
+            return False
+        return all(self._find_table_by_headers(doc, headers) is not None for headers in _DATA_TABLE_HEADERS)
+
+    def _set_first_cell_text(self, table: Table, text: str) -> None:
+        """Write text into the styled run of a single-cell section table."""
+        para = self._row_cells(table, table.rows[0])[0].paragraphs[0]
+        runs = para.runs
+        run = runs[0] if runs else para.add_run()
+        run.text = text
+
+    def populate_header(self, doc: DocxDocument, contact_info: dict) -> None:
+        """Fill the candidate name and title runs that open the document."""
+        # The header section is the first thing build_skeleton() adds
+        name_para, title_para = doc.paragraphs[:2]
+        name_para.runs[0].text = str(contact_info.get('name', ''))
+        title_para.runs[0].text = f"({contact_info.get('title', 'Professional Title')})"
+
+    def populate_summary(self, doc: DocxDocument, ctx: dict[str, Any]) -> None:
+        """Render the summary bullets (or plain summary) into the Profile Summary box."""
+        table = self._table_after_heading(doc, 'Profile Summary')
+        if table is None:
+            raise ValueError("Profile Summary table not found")
+        self._set_first_cell_text(table, render_template('summary', ctx).strip())
+
+    def populate_experience(self, doc: DocxDocument, experience: Sequence[dict] | None) -> None:
+        """Render the project entries into the Relevant Work Experience box."""
+        table = self._table_after_heading(doc, 'Relevant Work Experience')
+        if table is None:
+            raise ValueError("Relevant Work Experience table not found")
+        text = render_template('experience', {'experience': experience or []})
+        self._set_first_cell_text(table, text.strip())
+
+    def _fill_table_rows(self, table: Table, items: Sequence[dict] | None,
+                         row_texts: Callable[[dict], list[str]]) -> None:
+        """Replace the table's template row (row 1) with one filled copy per item.
+
+        row_texts gives an item's cell texts in column order. A table with only its
+        header row (e.g. an edited template) gets a plain row to copy instead.
+        """
+        # Keep header row (0) and template row (1)
+        self._clear_data_rows(table, header_rows=2)
+        tbl = table._tbl
+        proto = table.rows[1]._tr if len(table.rows) >= 2 else table.add_row()._tr
+        new_trs: list[BaseOxmlElement] = []
+        for item in items or []:
+            new_tr = deepcopy(proto)
+            for tc, text in zip(new_tr.tc_lst, row_texts(item)):
+                self._fast_cell_set(table, tc, text)
+            new_trs.append(new_tr)
+        # Swap the template row for the filled rows in one batch
+        tbl.remove(proto)
+        tbl.extend(new_trs)
+
+    @staticmethod
+    def _field_texts(*keys: str) -> Callable[[dict], list[str]]:
+        """Row texts taken from the given keys of an item, stripped"""
+        return lambda item: [str(item.get(key, '')).strip() for key in keys]
+
+    @staticmethod
+    def _project_row_texts(project: dict) -> list[str]:
+        """Name, duration and comma-joined technologies of an other-projects entry"""
+        techs = project.get('technologies') or []
+        if isinstance(techs, list):
+            techs_text = ', '.join(t for t in (str(x).strip() for x in techs) if t)
+        else:
+            techs_text = str(techs)
+        return [str(project.get('name', '')).strip(), str(project.get('duration', '')).strip(), techs_text]
+
+    def populate_skills(self, doc: DocxDocument, skills_rows: Sequence[dict] | None) -> None:
         """Populate the Tools and Technologies table using 'Category'/'Skills' headers."""
         table = self._find_table_by_headers(doc, ['Category', 'Skills'])
         if table is None:
             raise ValueError("Skills table not found (headers 'Category'|'Skills')")
-        # Keep header row (0) and template row (1)
-        self._clear_data_rows(table, header_rows=2)
-        template_row_idx = 1
-        for row in skills_rows or []:
-            new_row = self._clone_row(table, template_row_idx)
-            new_row.cells[0].text = str(row.get('left', '')).strip()
-            new_row.cells[1].text = str(row.get('right', '')).strip()
-        # Remove the template row
-        if len(table.rows) > 1:
-            self._remove_row(table, template_row_idx)
-
-    def populate_other_projects(self, doc, other_projects: list[dict]):
+        self._fill_table_rows(table, skills_rows, self._field_texts('left', 'right'))
+
+    def populate_other_projects(self, doc: DocxDocument, other_projects: Sequence[dict] | None) -> None:
         """Populate the Other Notable Projects 3-col table by headers."""
         table = self._find_table_by_headers(doc, ['Project Name', 'Duration', 'Technology'])
         if table is None:
             raise ValueError("Other Notable Projects table not found")
-        # Ensure there is a template row at index 1
-        if len(table.rows) > 1:
-            header_rows = 2
-            template_row_idx = 1
-        else:
-            # Add a blank template row
-            table.add_row()
-            header_rows = 2
-            template_row_idx = 1
-        # Clear data rows but keep header + template
-        self._clear_data_rows(table, header_rows=header_rows)
-        for p in other_projects or []:
-            new_row = self._clone_row(table, template_row_idx)
-            new_row.cells[0].text = str(p.get('name', '')).strip()
-            new_row.cells[1].text = str(p.get('duration', '')).strip()
-            techs = p.get('technologies') or []
-            if isinstance(techs, list):
-                techs_text = ', '.join([str(x) for x in techs if str(x).strip()])
-            else:
-                techs_text = str(techs)
-            new_row.cells[2].text = techs_text
-        # Remove the template row
-        if len(table.rows) > 1:
-            self._remove_row(table, template_row_idx)
-
-    def populate_education(self, doc, education: list[dict]):
+        self._fill_table_rows(table, other_projects, self._project_row_texts)
+
+    def populate_education(self, doc: DocxDocument, education: Sequence[dict] | None) -> None:
         """Populate the Education Details 3-col table by headers."""
         table = self._find_table_by_headers(doc, ['Course', 'University / Board', 'Year of Passing'])
         if table is None:
             raise ValueError("Education table not found")
-        if len(table.rows) > 1:
-            header_rows = 2
-            template_row_idx = 1
-        else:
-            table.add_row()
-            header_rows = 2
-            template_row_idx = 1
-        self._clear_data_rows(table, header_rows=header_rows)
-        for e in education or []:
-            new_row = self._clone_row(table, template_row_idx)
-            new_row.cells[0].text = str(e.get('degree', '')).strip()
-            new_row.cells[1].text = str(e.get('institution', '')).strip()
-            new_row.cells[2].text = str(e.get('graduation_date', '')).strip()
-        # Remove the template row
-        if len(table.rows) > 1:
-            self._remove_row(table, template_row_idx)
-
-    def populate_certifications(self, doc, cert_rows: list[dict]):
+        self._fill_table_rows(table, education, self._field_texts('degree', 'institution', 'graduation_date'))
+
+    def populate_certifications(self, doc: DocxDocument, cert_rows: Sequence[dict] | None) -> None:
         """Populate the Certifications 2-col table by headers."""
         table = self._find_table_by_headers(doc, ['Sr.No', 'University/Board'])
         if table is None:
             raise ValueError("Certifications table not found")
-        if len(table.rows) > 1:
-            header_rows = 2
-            template_row_idx = 1
-        else:
-            table.add_row()
-            header_rows = 2
-            template_row_idx = 1
-        self._clear_data_rows(table, header_rows=header_rows)
-        for r in cert_rows or []:
-            new_row = self._clone_row(table, template_row_idx)
-            new_row.cells[0].text = str(r.get('sno', '')).strip()
-            new_row.cells[1].text = str(r.get('authority', '')).strip()
-        # Remove the template row
-        if len(table.rows) > 1:
-            self._remove_row(table, template_row_idx)
+        self._fill_table_rows(table, cert_rows, self._field_texts('sno', 'authority'))
 
 
 # USAGE EXAMPLE
-def create_ezest_template():
+def create_ezest_template() -> None:
     """Create the complete e-Zest template"""
     generator = EZestCVTemplateGenerator()
     template_path = Path("ezest_complete_template.docx")
@@ -536,7 +710,7 @@ def create_ezest_template():
     print(f"Template created: {template_path}")
 
 # Integration with your existing TemplateEngine class
-def integrate_with_template_engine():
+def integrate_with_template_engine() -> None:
     """
     Add this method to your TemplateEngine class to use the new generator:
     
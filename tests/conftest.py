@@ -1,24 +1,36 @@
 import pytest
+import pytest_asyncio
 import asyncio
-import tempfile
-import shutil
+import sys
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock
+
+try:
+    import uvloop  # installed with uvicorn[standard] on non-Windows platforms
+except ImportError:
+    uvloop = None
 
 # Configure async test event loop
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    """Create an instance of the event loop for the test session (uvloop when available)."""
+    if uvloop is not None and sys.platform != "win32":
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests"""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path)
+@pytest_asyncio.fixture(scope="module")
+async def client():
+    """httpx AsyncClient driving the app in-process through ASGITransport, so requests
+    run on the test event loop instead of hopping through TestClient's portal thread.
+    The app defines no lifespan handlers, so nothing is lost by skipping them."""
+    import httpx
+    from app.main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 @pytest.fixture
 def mock_redis():
@@ -29,9 +41,9 @@ def mock_redis():
     mock_redis.delete.return_value = True
     return mock_redis
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_extracted_data():
-    """Sample extracted data for testing"""
+    """Sample extracted data for testing, validated once and shared by the session"""
     from app.models.schemas import ExtractedData, ContactInfo, Experience, Education
     
     return ExtractedData(
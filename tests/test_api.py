@@ -1,53 +1,93 @@
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
 import json
 import io
 
-from app.main import app
 from app.models.schemas import JobStatus, TemplateInfo, ExtractedData, ContactInfo
+# Import the service modules up front so their import cost is paid at collection,
+# not inside the first test that builds the client
+import app.services.document_processor  # noqa: F401
+import app.services.job_manager  # noqa: F401
+import app.services.template_engine  # noqa: F401
 
-client = TestClient(app)
+# Shared by the template endpoint tests; built once rather than per test
+_DEFAULT_TEMPLATE = TemplateInfo(
+    id="default",
+    name="Default Template",
+    description="Standard template",
+    version="1.0",
+    fields=["contact_info", "experience"],
+    created_at="2023-01-01T00:00:00",
+    updated_at="2023-01-01T00:00:00"
+)
 
+def _stub_upload_services(mocks, saved_filename):
+    """Configure the document processor and job manager mocks for an upload in one place"""
+    mocks.document_processor.save_uploaded_file = AsyncMock(return_value=saved_filename)
+    mocks.job_manager.create_job = AsyncMock(return_value="test-job-id")
+    mocks.job_manager.start_background_job = AsyncMock()
+
+# Service mocks behind api_client's dependency overrides; replaced before every test
+_api_mocks = SimpleNamespace(job_manager=Mock(), document_processor=Mock(), template_engine=Mock())
+
+@pytest.fixture(autouse=True)
+def _fresh_api_mocks():
+    """Give each test fresh service mocks, so nothing one test configures (return
+    values, attributes, call counts) leaks into the next"""
+    _api_mocks.job_manager = Mock()
+    _api_mocks.document_processor = Mock()
+    _api_mocks.template_engine = Mock()
+
+@pytest.fixture(scope="module")
+def api_client(client):
+    """The module's client with the service dependencies overridden by mocks.
+
+    Yields (client, mocks); tests configure mocks.job_manager / document_processor /
+    template_engine for the calls they exercise. The overrides are installed once and
+    read the mocks at call time, so they always see the current test's mocks.
+    """
+    from app.api.deps import get_document_processor, get_job_manager, get_template_engine
+    from app.main import app
+
+    mocks = _api_mocks
+    app.dependency_overrides[get_job_manager] = lambda: mocks.job_manager
+    app.dependency_overrides[get_document_processor] = lambda: mocks.document_processor
+    app.dependency_overrides[get_template_engine] = lambda: mocks.template_engine
+    yield client, mocks
+    app.dependency_overrides.clear()
+
+@pytest.mark.asyncio
 class TestAPI:
     """Test cases for API endpoints"""
     
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, client):
         """Test root endpoint"""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "HR Resume Formatter API"
         assert data["version"] == "1.0.0"
     
-    def test_health_check(self):
+    async def test_health_check(self, client):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "hr-resume-formatter"
     
-    @patch('app.services.job_manager.JobManager')
-    @patch('app.services.document_processor.DocumentProcessor')
-    def test_upload_single_resume(self, mock_doc_processor, mock_job_manager):
+    async def test_upload_single_resume(self, api_client):
         """Test single resume upload"""
-        # Mock services
-        mock_processor = Mock()
-        mock_processor.save_uploaded_file = AsyncMock(return_value="test_file.docx")
-        mock_doc_processor.return_value = mock_processor
-        
-        mock_manager = Mock()
-        mock_manager.create_job = AsyncMock(return_value="test-job-id")
-        mock_manager.start_background_job = AsyncMock()
-        mock_job_manager.return_value = mock_manager
+        client, mocks = api_client
+        _stub_upload_services(mocks, "test_file.docx")
         
         # Create test file
         file_content = b"fake docx content"
         files = {"file": ("test_resume.docx", io.BytesIO(file_content), "application/vnd.openxmlformats-officedocument.wordprocessingml.document")}
         data = {"template_id": "default"}
         
-        response = client.post("/api/v1/upload/single", files=files, data=data)
+        response = await client.post("/api/v1/upload/single", files=files, data=data)
         
         assert response.status_code == 200
         result = response.json()
@@ -55,110 +95,72 @@ class TestAPI:
         assert result["job_id"] == "test-job-id"
         assert "uploaded successfully" in result["message"]
     
-    def test_upload_invalid_file_type(self):
+    async def test_upload_invalid_file_type(self, client):
         """Test upload with invalid file type"""
         file_content = b"fake content"
         files = {"file": ("test_resume.txt", io.BytesIO(file_content), "text/plain")}
         data = {"template_id": "default"}
         
-        response = client.post("/api/v1/upload/single", files=files, data=data)
+        response = await client.post("/api/v1/upload/single", files=files, data=data)
         
         assert response.status_code == 400
         assert "Unsupported file type" in response.json()["detail"]
     
-    @patch('app.services.job_manager.JobManager')
-    def test_get_job_status(self, mock_job_manager):
+    async def test_get_job_status(self, api_client):
         """Test job status endpoint"""
+        client, mocks = api_client
         # Mock job manager
-        mock_manager = Mock()
+        mock_manager = mocks.job_manager
         mock_manager.get_job_status = AsyncMock(return_value={
             "job_id": "test-job-id",
             "status": "completed",
             "original_filename": "test.docx",
             "processing_time": 5.2
         })
-        mock_job_manager.return_value = mock_manager
         
-        response = client.get("/api/v1/jobs/test-job-id/status")
+        response = await client.get("/api/v1/jobs/test-job-id/status")
         
         assert response.status_code == 200
         data = response.json()
         assert data["job_id"] == "test-job-id"
         assert data["status"] == "completed"
     
-    @patch('app.services.job_manager.JobManager')
-    def test_get_job_status_not_found(self, mock_job_manager):
+    async def test_get_job_status_not_found(self, api_client):
         """Test job status for non-existent job"""
-        mock_manager = Mock()
+        client, mocks = api_client
+        mock_manager = mocks.job_manager
         mock_manager.get_job_status = AsyncMock(return_value={"error": "Job not found"})
-        mock_job_manager.return_value = mock_manager
         
-        response = client.get("/api/v1/jobs/nonexistent-job/status")
+        response = await client.get("/api/v1/jobs/nonexistent-job/status")
         
         assert response.status_code == 404
     
-    @patch('app.services.template_engine.TemplateEngine')
-    def test_list_templates(self, mock_template_engine):
-        """Test templates listing endpoint"""
-        mock_engine = Mock()
-        mock_engine.list_templates.return_value = [
-            TemplateInfo(
-                id="default",
-                name="Default Template",
-                description="Standard template",
-                version="1.0",
-                fields=["contact_info", "experience"],
-                created_at="2023-01-01T00:00:00",
-                updated_at="2023-01-01T00:00:00"
-            )
-        ]
-        mock_template_engine.return_value = mock_engine
-        
-        response = client.get("/api/v1/templates/")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["id"] == "default"
-        assert data[0]["name"] == "Default Template"
-    
-    @patch('app.services.template_engine.TemplateEngine')
-    def test_get_template(self, mock_template_engine):
-        """Test get specific template endpoint"""
-        mock_engine = Mock()
-        mock_engine.get_template_info.return_value = TemplateInfo(
-            id="default",
-            name="Default Template",
-            description="Standard template",
-            version="1.0",
-            fields=["contact_info", "experience"],
-            created_at="2023-01-01T00:00:00",
-            updated_at="2023-01-01T00:00:00"
-        )
-        mock_template_engine.return_value = mock_engine
-        
-        response = client.get("/api/v1/templates/default")
-        
-        assert response.status_code == 200
+    @pytest.mark.parametrize("path, mock_attr, mock_return, expected_status", [
+        ("/api/v1/templates/", "list_templates", [_DEFAULT_TEMPLATE], 200),
+        ("/api/v1/templates/default", "get_template_info", _DEFAULT_TEMPLATE, 200),
+        ("/api/v1/templates/nonexistent", "get_template_info", None, 404),
+    ])
+    async def test_template_endpoints(self, api_client, path, mock_attr, mock_return, expected_status):
+        """Test templates listing and get-template endpoints"""
+        client, mocks = api_client
+        getattr(mocks.template_engine, mock_attr).return_value = mock_return
+        
+        response = await client.get(path)
+        
+        assert response.status_code == expected_status
+        if expected_status != 200:
+            return
         data = response.json()
+        if isinstance(mock_return, list):
+            assert len(data) == 1
+            data = data[0]
         assert data["id"] == "default"
         assert data["name"] == "Default Template"
     
-    @patch('app.services.template_engine.TemplateEngine')
-    def test_get_template_not_found(self, mock_template_engine):
-        """Test get non-existent template"""
-        mock_engine = Mock()
-        mock_engine.get_template_info.return_value = None
-        mock_template_engine.return_value = mock_engine
-        
-        response = client.get("/api/v1/templates/nonexistent")
-        
-        assert response.status_code == 404
-    
-    @patch('app.services.template_engine.TemplateEngine')
-    def test_template_preview(self, mock_template_engine):
+    async def test_template_preview(self, api_client):
         """Test template preview endpoint"""
-        mock_engine = Mock()
+        client, mocks = api_client
+        mock_engine = mocks.template_engine
         mock_engine.get_template_preview.return_value = {
             "template_id": "default",
             "structure": {
@@ -168,32 +170,33 @@ class TestAPI:
                 ]
             }
         }
-        mock_template_engine.return_value = mock_engine
         
-        response = client.get("/api/v1/templates/default/preview")
+        response = await client.get("/api/v1/templates/default/preview")
         
         assert response.status_code == 200
         data = response.json()
         assert data["template_id"] == "default"
         assert "structure" in data
     
-    def test_batch_upload_too_many_files(self):
+    async def test_batch_upload_too_many_files(self, client):
         """Test batch upload with too many files"""
-        files = []
-        for i in range(12):  # More than the limit of 10
-            file_content = b"fake content"
-            files.append(("files", (f"test_{i}.docx", io.BytesIO(file_content), "application/vnd.openxmlformats-officedocument.wordprocessingml.document")))
+        # The endpoint rejects on file count before reading any part, so empty
+        # bodies are enough; raw bytes avoid wrapping each part in a BytesIO
+        files = [
+            ("files", (f"test_{i}.docx", b"", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"))
+            for i in range(12)  # More than the limit of 10
+        ]
         
         data = {"template_id": "default"}
         
-        response = client.post("/api/v1/upload/batch", files=files, data=data)
+        response = await client.post("/api/v1/upload/batch", files=files, data=data)
         
         assert response.status_code == 400
         assert "Maximum 10 files" in response.json()["detail"]
     
-    @patch('app.services.job_manager.JobManager')
-    def test_cancel_job(self, mock_job_manager):
+    async def test_cancel_job(self, api_client):
         """Test job cancellation"""
+        client, mocks = api_client
         from app.models.schemas import ProcessingJob, JobStatus
         
         mock_job = ProcessingJob(
@@ -203,39 +206,29 @@ class TestAPI:
             original_filename="test.docx"
         )
         
-        mock_manager = Mock()
+        mock_manager = mocks.job_manager
         mock_manager.get_job = AsyncMock(return_value=mock_job)
         mock_manager.update_job_status = AsyncMock(return_value=True)
         mock_manager.document_processor = Mock()
         mock_manager.document_processor.cleanup_file = Mock(return_value=True)
-        mock_job_manager.return_value = mock_manager
         
-        response = client.delete("/api/v1/jobs/test-job-id")
+        response = await client.delete("/api/v1/jobs/test-job-id")
         
         assert response.status_code == 200
         data = response.json()
         assert data["job_id"] == "test-job-id"
         assert "cancelled successfully" in data["message"]
     
-    @patch('app.services.job_manager.JobManager')
-    @patch('app.services.document_processor.DocumentProcessor')
-    def test_upload_single_pdf(self, mock_doc_processor, mock_job_manager):
+    async def test_upload_single_pdf(self, api_client):
         """Test single PDF upload is accepted and processed via job manager"""
-        # Mock services
-        mock_processor = Mock()
-        mock_processor.save_uploaded_file = AsyncMock(return_value="test_file.pdf")
-        mock_doc_processor.return_value = mock_processor
-        
-        mock_manager = Mock()
-        mock_manager.create_job = AsyncMock(return_value="test-job-id")
-        mock_manager.start_background_job = AsyncMock()
-        mock_job_manager.return_value = mock_manager
+        client, mocks = api_client
+        _stub_upload_services(mocks, "test_file.pdf")
         
         # Create test file
         file_content = b"%PDF-1.4 minimal"
         files = {"file": ("test_resume.pdf", io.BytesIO(file_content), "application/pdf")}
         # Do not pass template_id so default is used (ezest-updated)
-        response = client.post("/api/v1/upload/single", files=files)
+        response = await client.post("/api/v1/upload/single", files=files)
         
         assert response.status_code == 200
         result = response.json()
@@ -243,9 +236,9 @@ class TestAPI:
         assert result["job_id"] == "test-job-id"
         assert "uploaded successfully" in result["message"]
     
-    @patch('app.services.job_manager.JobManager')
-    def test_cancel_completed_job(self, mock_job_manager):
+    async def test_cancel_completed_job(self, api_client):
         """Test cancelling already completed job"""
+        client, mocks = api_client
         from app.models.schemas import ProcessingJob, JobStatus
         
         mock_job = ProcessingJob(
@@ -255,11 +248,11 @@ class TestAPI:
             original_filename="test.docx"
         )
         
-        mock_manager = Mock()
+        mock_manager = mocks.job_manager
         mock_manager.get_job = AsyncMock(return_value=mock_job)
-        mock_job_manager.return_value = mock_manager
         
-        response = client.delete("/api/v1/jobs/test-job-id")
+        response = await client.delete("/api/v1/jobs/test-job-id")
         
         assert response.status_code == 400
         assert "Cannot cancel completed job" in response.json()["detail"]
+        mock_manager.update_job_status.assert_not_called()
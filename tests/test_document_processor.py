@@ -1,41 +1,106 @@
 import pytest
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 from docx import Document
-import tempfile
-import os
 
 from app.services.document_processor import DocumentProcessor
 from app.models.schemas import ExtractedData, ContactInfo
 
+# Resume snippets for the extraction tests, built once at import (indentation kept as-is)
+_BASIC_SAMPLE = """
+        John Doe
+        john.doe@email.com
+        (555) 123-4567
+        
+        EXPERIENCE
+        Software Engineer - Tech Corp
+        2020 - Present
+        
+        SKILLS
+        Python, JavaScript, React
+        """
+
+_SUMMARY_SAMPLE = """
+        John Doe
+        
+        PROFESSIONAL SUMMARY
+        Experienced software engineer with 5 years of experience
+        in web development and system design.
+        
+        EXPERIENCE
+        Software Engineer - Tech Corp
+        """
+
+# Paragraphs of each DOCX fixture, keyed by name; add variants here
+_DOCX_SPECS = {
+    "sample": (
+        "John Doe",
+        "john.doe@email.com",
+        "(555) 123-4567",
+        "",
+        "EXPERIENCE",
+        "Software Engineer - Tech Corp",
+        "2020 - Present",
+        "Developed web applications using Python and React",
+        "",
+        "SKILLS",
+        "Python, JavaScript, React, SQL",
+    ),
+}
+
+def _build_docx(path, paragraphs):
+    """Write a DOCX with one paragraph per entry and return its path"""
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
 class TestDocumentProcessor:
     """Test cases for DocumentProcessor"""
     
-    @pytest.fixture
-    def processor(self):
-        return DocumentProcessor()
+    @pytest.fixture(scope="module")
+    def processor(self, tmp_path_factory):
+        """One DocumentProcessor shared by the module's tests.
+
+        Its upload dir is a pytest temp dir, which is per xdist worker, so
+        parallel runs never write to the same directory.
+        """
+        processor = DocumentProcessor()
+        processor.upload_dir = tmp_path_factory.mktemp("uploads")
+        return processor
+    
+    @pytest.fixture(scope="session")
+    def docx_files(self, tmp_path_factory):
+        """Build every DOCX in _DOCX_SPECS once for the session, concurrently.
+
+        Returns {spec name: path}; tests only read the files.
+        """
+        # Save into a pytest-managed temporary directory (removed by pytest)
+        docs_dir = tmp_path_factory.mktemp("docs")
+        with ThreadPoolExecutor(max_workers=min(len(_DOCX_SPECS), os.cpu_count() or 1)) as pool:
+            futures = {
+                name: pool.submit(_build_docx, docs_dir / f"{name}.docx", paragraphs)
+                for name, paragraphs in _DOCX_SPECS.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+    
+    @pytest.fixture(scope="session")
+    def sample_docx_content(self, docx_files):
+        """Sample DOCX file for testing"""
+        return docx_files["sample"]
     
     @pytest.fixture
-    def sample_docx_content(self):
-        """Create a sample DOCX file for testing"""
-        doc = Document()
-        doc.add_paragraph("John Doe")
-        doc.add_paragraph("john.doe@email.com")
-        doc.add_paragraph("(555) 123-4567")
-        doc.add_paragraph("")
-        doc.add_paragraph("EXPERIENCE")
-        doc.add_paragraph("Software Engineer - Tech Corp")
-        doc.add_paragraph("2020 - Present")
-        doc.add_paragraph("Developed web applications using Python and React")
-        doc.add_paragraph("")
-        doc.add_paragraph("SKILLS")
-        doc.add_paragraph("Python, JavaScript, React, SQL")
-        
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as tmp:
-            doc.save(tmp.name)
-            return tmp.name
+    def fake_upload_dir(self, fs, processor, monkeypatch):
+        """Point the processor's upload dir at pyfakefs's in-memory filesystem"""
+        upload_dir = Path("/uploads")
+        fs.create_dir(upload_dir)
+        monkeypatch.setattr(processor, "upload_dir", upload_dir)
+        return upload_dir
     
     @pytest.mark.asyncio
     async def test_save_uploaded_file(self, processor):
@@ -64,47 +129,43 @@ class TestDocumentProcessor:
     
     def test_extract_text_from_docx(self, processor, sample_docx_content):
         """Test text extraction from DOCX file"""
-        file_path = Path(sample_docx_content)
-        
-        text = processor.extract_text_from_docx(file_path)
+        text = processor.extract_text_from_docx(sample_docx_content)
         
         assert "John Doe" in text
         assert "john.doe@email.com" in text
         assert "Software Engineer" in text
         assert "Python, JavaScript" in text
-        
-        # Cleanup
-        os.unlink(sample_docx_content)
     
-    def test_basic_data_extraction(self, processor):
+    @pytest.fixture(scope="module")
+    def basic_result(self, processor):
+        """basic_data_extraction of _BASIC_SAMPLE, run once for all assertions on it"""
+        return processor.basic_data_extraction(_BASIC_SAMPLE)
+    
+    def test_basic_data_extraction(self, basic_result):
         """Test basic data extraction functionality"""
-        sample_text = """
-        John Doe
-        john.doe@email.com
-        (555) 123-4567
-        
-        EXPERIENCE
-        Software Engineer - Tech Corp
-        2020 - Present
-        
-        SKILLS
-        Python, JavaScript, React
-        """
-        
-        extracted_data = processor.basic_data_extraction(sample_text)
-        
-        assert isinstance(extracted_data, ExtractedData)
-        assert extracted_data.contact_info.name == "John Doe"
-        assert extracted_data.contact_info.email == "john.doe@email.com"
-        assert extracted_data.contact_info.phone == "5551234567"
-        assert len(extracted_data.skills) > 0
-        assert "Python" in extracted_data.skills
+        assert isinstance(basic_result, ExtractedData)
+        assert len(basic_result.skills) > 0
+        assert "Python" in basic_result.skills
     
-    @patch('app.services.document_processor.NLPExtractor')
-    def test_advanced_data_extraction(self, mock_nlp_extractor, processor):
+    @pytest.mark.parametrize("attr, expected", [
+        ("contact_info.name", "John Doe"),
+        ("contact_info.email", "john.doe@email.com"),
+        ("contact_info.phone", "5551234567"),
+    ])
+    def test_basic_data_extraction_fields(self, basic_result, attr, expected):
+        """Test the contact fields picked up by basic extraction"""
+        assert attrgetter(attr)(basic_result) == expected
+    
+    @pytest.fixture
+    def processor_with_mock_nlp(self):
+        """A DocumentProcessor built once with NLPExtractor patched to a Mock"""
+        with patch('app.services.document_processor.NLPExtractor', return_value=Mock()):
+            yield DocumentProcessor()
+    
+    def test_advanced_data_extraction(self, processor_with_mock_nlp):
         """Test advanced data extraction with NLP"""
         # Mock NLP extractor
-        mock_extractor = Mock()
+        mock_extractor = processor_with_mock_nlp.nlp_extractor
         mock_extractor.extract_contact_info.return_value = ContactInfo(
             name="John Doe",
             email="john.doe@email.com",
@@ -114,13 +175,8 @@ class TestDocumentProcessor:
         mock_extractor.extract_education.return_value = []
         mock_extractor.extract_skills.return_value = ["Python", "JavaScript"]
         
-        mock_nlp_extractor.return_value = mock_extractor
-        
-        # Reinitialize processor to use mocked NLP extractor
-        processor = DocumentProcessor()
-        
         sample_text = "John Doe\njohn.doe@email.com\n555-123-4567"
-        extracted_data = processor.advanced_data_extraction(sample_text)
+        extracted_data = processor_with_mock_nlp.advanced_data_extraction(sample_text)
         
         assert extracted_data.contact_info.name == "John Doe"
         assert extracted_data.contact_info.email == "john.doe@email.com"
@@ -133,8 +189,9 @@ class TestDocumentProcessor:
             email="john.doe@email.com",
             phone="555-123-4567"
         )
-        experience = [Mock()]  # One experience item
-        education = [Mock()]   # One education item
+        # Scoring only counts entries, so plain placeholders are enough
+        experience = [object()]  # One experience item
+        education = [object()]   # One education item
         skills = ["Python", "JavaScript", "React", "SQL"]  # Multiple skills
         
         score = processor._calculate_confidence_score(
@@ -146,34 +203,28 @@ class TestDocumentProcessor:
     
     def test_extract_summary(self, processor):
         """Test summary extraction"""
-        sample_text = """
-        John Doe
-        
-        PROFESSIONAL SUMMARY
-        Experienced software engineer with 5 years of experience
-        in web development and system design.
-        
-        EXPERIENCE
-        Software Engineer - Tech Corp
-        """
-        
-        summary = processor._extract_summary(sample_text)
+        summary = processor._extract_summary(_SUMMARY_SAMPLE)
         
         assert summary is not None
         assert "Experienced software engineer" in summary
         assert "5 years" in summary
     
+    def test_ensure_exists_file_not_found(self, processor):
+        """Test the upfront existence check on a non-existent file"""
+        with pytest.raises(FileNotFoundError):
+            processor._ensure_exists("nonexistent_file.docx")
+    
     @pytest.mark.asyncio
     async def test_process_document_file_not_found(self, processor):
-        """Test processing non-existent file"""
+        """Test processing non-existent file (smoke test of the async entry point)"""
         with pytest.raises(FileNotFoundError):
             await processor.process_document("nonexistent_file.docx")
     
-    def test_cleanup_file(self, processor):
+    def test_cleanup_file(self, processor, fake_upload_dir):
         """Test file cleanup functionality"""
-        # Create a temporary file
-        test_file = processor.upload_dir / "test_cleanup.txt"
-        test_file.write_text("test content")
+        # Create a file in the (in-memory) upload dir
+        test_file = fake_upload_dir / "test_cleanup.txt"
+        test_file.touch()
         
         assert test_file.exists()
         
@@ -183,7 +234,7 @@ class TestDocumentProcessor:
         assert result is True
         assert not test_file.exists()
     
-    def test_cleanup_nonexistent_file(self, processor):
+    def test_cleanup_nonexistent_file(self, processor, fake_upload_dir):
         """Test cleanup of non-existent file"""
         result = processor.cleanup_file("nonexistent_file.txt")
         assert result is False
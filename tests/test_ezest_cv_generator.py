@@ -0,0 +1,185 @@
+import pytest
+import importlib.util
+from io import BytesIO
+from pathlib import Path
+from docx import Document
+
+# The generator lives with the templates, outside the app package; load it from source
+GENERATOR_PATH = Path(__file__).resolve().parents[1] / "templates" / "ezest-code-gen" / "ezest_cv_generator.py"
+_spec = importlib.util.spec_from_file_location("ezest_cv_generator", GENERATOR_PATH)
+ezest_cv_generator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ezest_cv_generator)
+
+EZestCVTemplateGenerator = ezest_cv_generator.EZestCVTemplateGenerator
+EZestStyle = ezest_cv_generator.EZestStyle
+
+# Shaped like TemplateEngine._prepare_template_context output
+_CONTEXT = {
+    "contact_info": {"name": "Jane Doe", "title": "Senior ServiceNow Developer"},
+    "summary": "Senior developer; ServiceNow specialist",
+    "summary_bullets": ["8 years of ServiceNow development", "Led ITSM rollouts for 3 clients"],
+    "skills_rows": [
+        {"left": "ServiceNow Modules", "right": "ITSM, ITOM"},
+        {"left": "Languages", "right": "JavaScript, Python"},
+    ],
+    "experience": [{
+        "start_date": "May 2022",
+        "end_date": "Present",
+        "description": "Service portal for a global retailer",
+        "project_description": "Service portal for a global retailer",
+        "technologies": ["ServiceNow", "JavaScript"],
+        "responsibilities": ["Built catalog items", "Automated approvals"],
+    }],
+    "other_projects": [
+        {"name": "HR Portal", "duration": "2019 - 2020", "technologies": ["ServiceNow", " ", "AngularJS"]},
+    ],
+    "education": [
+        {"degree": "B.E. Computer Engineering", "institution": "University of Pune", "graduation_date": "2015"},
+    ],
+    "certifications_rows": [
+        {"sno": 1, "authority": "ServiceNow"},
+        {"sno": 2, "authority": "Amazon Web Services"},
+    ],
+}
+
+def _rows(table):
+    """Cell texts of every row after the header"""
+    return [[c.text for c in row.cells] for row in table.rows[1:]]
+
+def _save(doc):
+    """The document's .docx bytes"""
+    buf = BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+class TestEZestCVTemplateGenerator:
+    """Test cases for the ezest-coded template generator"""
+
+    @pytest.fixture
+    def generated_docx(self, tmp_path):
+        """A skeleton written to disk by create_complete_template"""
+        path = tmp_path / "ezest-coded.docx"
+        EZestCVTemplateGenerator().create_complete_template(path)
+        return path
+
+    def test_build_skeleton_on_generated_base_template(self, generated_docx):
+        """Test that a previous generator output works as a base template"""
+        style = EZestStyle(base_template=generated_docx)
+
+        doc = EZestCVTemplateGenerator(style).build_skeleton()
+
+        # Styles are reused rather than added twice, and still take the style's fonts
+        assert [s.name for s in doc.styles].count("EZBody") == 1
+        assert doc.styles["EZBody"].font.name == style.body_font
+        assert doc.styles["EZName"].font.size == style.name_font_size
+        # The base document's content is replaced, not appended to
+        headings = [p.text for p in doc.paragraphs if p.text]
+        assert headings.count("Profile Summary") == 1
+
+    def test_populate_table_without_template_row(self):
+        """Test filling a data table whose template row was removed from the template"""
+        generator = EZestCVTemplateGenerator()
+        doc = generator.build_skeleton()
+        table = generator._find_table_by_headers(doc, ["Course", "University / Board", "Year of Passing"])
+        table._tbl.remove(table.rows[1]._tr)
+
+        generator.populate_education(doc, [
+            {"degree": "B.E. Computer Engineering", "institution": "University of Pune", "graduation_date": "2015"},
+        ])
+
+        assert [[c.text for c in row.cells] for row in table.rows[1:]] == [
+            ["B.E. Computer Engineering", "University of Pune", "2015"],
+        ]
+
+    @pytest.mark.parametrize("rows,expected", [
+        (None, []),
+        (({"degree": "B.E. Computer Engineering", "institution": "University of Pune", "graduation_date": "2015"},),
+         [["B.E. Computer Engineering", "University of Pune", "2015"]]),
+    ])
+    def test_populate_accepts_none_and_tuples(self, rows, expected):
+        """Test that populate_* take any sequence or None, as the compiled build checks argument types"""
+        generator = EZestCVTemplateGenerator()
+        doc = generator.build_skeleton()
+
+        generator.populate_education(doc, rows)
+        generator.populate_experience(doc, rows)
+
+        table = generator._find_table_by_headers(doc, ["Course", "University / Board", "Year of Passing"])
+        assert _rows(table) == expected
+
+    def test_render_generated_template(self, generated_docx):
+        """Test rendering a CV into the on-disk skeleton, as apply_template does"""
+        generator = EZestCVTemplateGenerator()
+        doc = Document(generated_docx)
+        assert generator.matches_skeleton(doc)
+
+        generator.render(doc, _CONTEXT)
+        doc = Document(BytesIO(_save(doc)))
+
+        assert doc.paragraphs[0].text == "Jane Doe"
+        assert doc.paragraphs[1].text == "(Senior ServiceNow Developer)"
+        summary = generator._table_after_heading(doc, "Profile Summary")
+        assert summary.cell(0, 0).text.splitlines() == [
+            "○ 8 years of ServiceNow development",
+            "○ Led ITSM rollouts for 3 clients",
+        ]
+        experience = generator._table_after_heading(doc, "Relevant Work Experience").cell(0, 0).text
+        assert "Project #1 Duration: May 2022 - Present" in experience
+        assert "- Automated approvals" in experience
+        assert _rows(generator._find_table_by_headers(doc, ["Category", "Skills"])) == [
+            ["ServiceNow Modules", "ITSM, ITOM"],
+            ["Languages", "JavaScript, Python"],
+        ]
+        assert _rows(generator._find_table_by_headers(doc, ["Project Name", "Duration", "Technology"])) == [
+            ["HR Portal", "2019 - 2020", "ServiceNow, AngularJS"],
+        ]
+        assert _rows(generator._find_table_by_headers(doc, ["Course", "University / Board", "Year of Passing"])) == [
+            ["B.E. Computer Engineering", "University of Pune", "2015"],
+        ]
+        assert _rows(generator._find_table_by_headers(doc, ["Sr.No", "University/Board"])) == [
+            ["1", "ServiceNow"],
+            ["2", "Amazon Web Services"],
+        ]
+
+    def test_matches_skeleton_rejects_placeholder_template(self):
+        """Test that an older docxtpl-style template is not taken for a skeleton"""
+        generator = EZestCVTemplateGenerator()
+        doc = generator.build_skeleton()
+        doc.paragraphs[0].runs[0].text = "{{ contact_info.name }}"
+
+        assert not generator.matches_skeleton(doc)
+
+    def test_matches_skeleton_rejects_missing_section(self):
+        """Test that a template without the Profile Summary table is not taken for a skeleton"""
+        generator = EZestCVTemplateGenerator()
+        doc = generator.build_skeleton()
+        summary = generator._table_after_heading(doc, "Profile Summary")
+        summary._tbl.getparent().remove(summary._tbl)
+
+        assert not generator.matches_skeleton(doc)
+
+
+class TestLoadGeneratorModule:
+    """Test cases for loading the generator, compiled build first"""
+
+    def test_falls_back_to_source_when_compiled_build_raises(self, tmp_path, monkeypatch):
+        """Test that a compiled build failing with a non-ImportError falls back to the source"""
+        from app.services import template_engine
+
+        gen_path = tmp_path / "ezest_cv_generator.py"
+        gen_path.write_text("GENERATOR = 'source'\n")
+        compiled = tmp_path / "ezest_cv_generator.compiled.so"
+        compiled.touch()
+        real_exec = template_engine._exec_generator_module
+
+        def exec_module(module_path):
+            if module_path == compiled:
+                raise TypeError("broken compiled module body")
+            return real_exec(module_path)
+
+        monkeypatch.setattr(template_engine, "_compiled_generator_path", lambda path: compiled)
+        monkeypatch.setattr(template_engine, "_exec_generator_module", exec_module)
+
+        module = template_engine.load_generator_module(gen_path)
+
+        assert module.GENERATOR == "source"